@@ -2,350 +2,1049 @@
 使用Playwright自动化爬取青塔自科云基金项目数据
 支持自定义关键词和年份范围
 """
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+import aiohttp
+import lxml.html
+import orjson
+import asyncio
 import csv
-import json
+import hashlib
+import math
+import multiprocessing
 import re
-import time
 import os
+import time
+from urllib.parse import urlparse
 import argparse
+from typing import NamedTuple
+
+SEARCH_URL = "https://fund.cingta.com/fund/list?keyword={keyword}&searchtype=(立项年份={start_year}-{end_year})"
+
+# 已解析页面的磁盘缓存目录和有效期（秒），重新运行时跳过缓存有效的页面
+CACHE_DIR = 'cache'
+CACHE_EXPIRE = 86400
+# 缓存内容格式的版本，列表项文本的格式变化时加1，使旧缓存直接失效
+CACHE_VERSION = 2
+
+# 无头爬取阶段的浏览器启动参数，关闭图片、扩展和GPU以减少内存和CPU占用
+HEADLESS_ARGS = [
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+    '--blink-settings=imagesEnabled=false',
+]
+
+# 列表数据用不到的资源类型和统计域名，在无头爬取阶段直接拦截
+BLOCKED_RESOURCE_TYPES = {'image', 'stylesheet', 'font', 'media', 'other'}
+BLOCKED_HOSTS = ('google-analytics.com', 'googletagmanager.com', 'baidu.com')
+
+# 预编译正则表达式，避免在逐项目解析时重复查找缓存
+_RE_TOTAL = re.compile(r'项目数\s*([\d,]+)')  # 总项目数可能带千分位逗号
+_RE_TITLE_CLEAN = re.compile(r'收藏.*$')
+
+# 详细信息各字段合并为一个带命名分组的正则，一次扫描提取全部字段
+# 各条目之间以换行分隔，字段值不跨行，并在遇到下一个字段标签时结束，避免吞并其他条目的内容
+_LABEL_AHEAD = r'(?=[^\S\n]*(?:¥|金额|受资机构|负责人|立项年份|资助机构|申报领域)|\n|$)'
+_RE_FIELDS = re.compile(
+    r'(?:¥|金额[：:])[^\S\n]*(?P<amount>[\d.]+)[^\S\n]*万元'
+    r'|受资机构[：:][^\S\n]*(?P<institution>[^\n]*?)' + _LABEL_AHEAD +
+    r'|负责人[：:][^\S\n]*(?P<pi>[^\n]*?)' + _LABEL_AHEAD +
+    r'|立项年份[：:][^\S\n]*(?P<year>\d{4})'
+    r'|资助机构[：:][^\S\n]*(?P<funder>[^\n]*?)' + _LABEL_AHEAD +
+    r'|申报领域[：:]*[^\S\n]*(?P<field>[^\n]*?)' + _LABEL_AHEAD
+)
+
+
+def page_url(search_url, page_num):
+    """构建指定页码的搜索URL"""
+    return f"{search_url}&page={page_num}"
+
+
+def parse_total_count(text):
+    """从结果信息文本中解析总项目数，未找到时返回0"""
+    total_match = _RE_TOTAL.search(text)
+    if total_match:
+        # 移除逗号并转换为整数
+        return int(total_match.group(1).replace(',', ''))
+    return 0
+
+
+class Project(NamedTuple):
+    """单个基金项目，字段顺序即CSV列顺序"""
+    title: str = ''
+    institution: str = ''
+    pi: str = ''
+    funder: str = ''
+    amount: str = ''
+    year: str = ''
+    field: str = ''
+
+
+def title_key(title):
+    """去重键：只保存标题哈希的低48位，长标题较多时能明显减少内存占用"""
+    return hash(title) & 0xFFFFFFFFFFFF
 
-def scrape_fund(keyword, start_year=2022, end_year=2026, login_wait=30):
+
+def extract_project(title_text, info_text, seen_titles):
     """
-    爬取基金项目数据
-    
+    从标题和详细信息文本中提取项目字段
+
     参数:
+        title_text: 标题文本，没有标题元素时为None
+        info_text: 详细信息各条目以换行合并后的文本
+        seen_titles: 去重集合
+
+    返回Project；没有标题或标题重复时返回None
+    """
+    if title_text is None:
+        return None
+    title_text = _RE_TITLE_CLEAN.sub('', title_text.strip()).strip()
+    if not title_text:
+        return None
+
+    # 去重检查
+    key = title_key(title_text)
+    if key in seen_titles:
+        return None
+    seen_titles.add(key)
+
+    fields = {}
+    for match in _RE_FIELDS.finditer(info_text):
+        name = match.lastgroup
+        value = match.group(name).strip()
+        if name == 'amount':
+            value += '万元'
+        elif name == 'field' and value == '--':
+            value = ''
+        fields[name] = value
+
+    return Project(title_text, **fields)
+
+
+def html_rows(html):
+    """
+    用lxml解析搜索结果页HTML
+
+    返回 (列表项文本, 结果信息文本)。每个列表项为 {'title': 标题, 'info': 详细信息文本}
+    """
+    if not html:
+        return [], ''
+
+    tree = lxml.html.fromstring(html)
+
+    rows = []
+    for item in tree.cssselect('.list-item'):
+        title_elems = item.cssselect('.title')
+        # text_content不会像innerText那样折叠空白，这里手动合并
+        rows.append({
+            'title': ' '.join(title_elems[0].text_content().split()) if title_elems else None,
+            'info': '\n'.join(' '.join(it.text_content().split()) for it in item.cssselect('.item-wrap .item')),
+        })
+
+    total_elems = tree.cssselect('.result-message')
+    total_text = total_elems[0].text_content() if total_elems else tree.text_content()
+    return rows, total_text
+
+
+async def read_items(page):
+    """取回当前页HTML并用lxml解析出所有列表项，避免逐个元素往返调用"""
+    rows, _ = html_rows(await page.content())
+    return rows
+
+
+def parse_rows(rows, seen_titles):
+    """解析html_rows返回的列表项文本，返回去重后的项目列表"""
+    projects = []
+
+    for row in rows:
+        project = extract_project(row['title'], row['info'], seen_titles)
+        if project:
+            projects.append(project)
+
+    return projects
+
+
+def parse_html(html, seen_titles):
+    """
+    解析搜索结果页HTML
+
+    返回 (去重后的项目列表, 本页列表项数, 总项目数)
+    """
+    rows, total_text = html_rows(html)
+    return parse_rows(rows, seen_titles), len(rows), parse_total_count(total_text)
+
+
+def cache_path(cache_key, page_num):
+    """缓存文件路径，cache_key形如 '关键词:2022-2022'"""
+    key = f"v{CACHE_VERSION}:{cache_key}:p{page_num}"
+    return os.path.join(CACHE_DIR, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+
+def cache_get(cache_key, page_num):
+    """读取未过期的缓存页，返回 {'rows': 列表项文本, 'total': 总项目数}，没有时返回None"""
+    path = cache_path(cache_key, page_num)
+    try:
+        if time.time() - os.path.getmtime(path) > CACHE_EXPIRE:
+            return None
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def cache_set(cache_key, page_num, rows, total_count=0):
+    """保存一页列表项文本（去重之前），空页不缓存"""
+    if not rows:
+        return
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(cache_path(cache_key, page_num), 'wb') as f:
+        f.write(orjson.dumps({'rows': rows, 'total': total_count}))
+
+
+async def fetch_html(session, url, max_retries=3):
+    """通过HTTP获取页面HTML，失败时重试，最终失败返回空字符串"""
+    for attempt in range(max_retries + 1):
+        try:
+            async with session.get(url) as resp:
+                resp.raise_for_status()
+                return await resp.text()
+        except Exception as e:
+            if attempt < max_retries:
+                print(f"请求失败，重试 {attempt + 1}/{max_retries}: {e}")
+                await asyncio.sleep(3)
+            else:
+                print(f"请求失败，已放弃: {url} {e}")
+    return ''
+
+
+async def probe_http(session, search_url):
+    """检查列表页能否直接通过HTTP获取：第1页包含列表项和总项目数，且页码参数有效"""
+    html = await fetch_html(session, search_url)
+    first_page, page_size, total_count = parse_html(html, set())
+    # 没有总项目数就无法确定页数，交给浏览器逐页点击
+    if not first_page or not total_count:
+        return False
+    if total_count <= page_size:
+        return True
+
+    html = await fetch_html(session, page_url(search_url, 2))
+    second_page, _, _ = parse_html(html, set())
+    return bool(second_page) and second_page[0].title != first_page[0].title
+
+
+async def fetch_rows_http(session, search_url, cache_key, page_num):
+    """
+    通过HTTP获取一页列表项文本，优先读取磁盘缓存，返回 (列表项文本, 总项目数)
+
+    请求失败时返回 (None, None)，以便与确实没有数据的空页区分
+    """
+    cached = cache_get(cache_key, page_num)
+    if cached is not None:
+        return cached['rows'], cached['total']
+
+    html = await fetch_html(session, search_url if page_num == 1 else page_url(search_url, page_num))
+    if not html:
+        return None, None
+    rows, total_text = html_rows(html)
+    total_count = parse_total_count(total_text)
+    cache_set(cache_key, page_num, rows, total_count)
+    return rows, total_count
+
+
+async def scrape_shard_http(session, writer, keyword, start_year, end_year, seen_titles, page_semaphore, max_pages=1000):
+    """
+    通过HTTP直接获取单个年份区间的全部分页，无需浏览器渲染
+
+    返回本分片写入的项目数
+
+    参数:
+        session: 携带登录cookies的aiohttp会话
+        writer: 逐页写入CSV的ProjectWriter
         keyword: 搜索关键词
         start_year: 起始年份
         end_year: 结束年份
-        login_wait: 登录等待时间（秒）
+        seen_titles: 各分片共享的去重集合
+        page_semaphore: 限制同时进行的请求数
+        max_pages: 最大页数
     """
-    all_projects = []
-    seen_titles = set()  # 用于去重
-    
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        
-        # 尝试加载已保存的cookie
-        cookie_file = 'cookies.json'
-        if os.path.exists(cookie_file):
-            with open(cookie_file, 'r') as f:
-                cookies = json.load(f)
-            context = browser.new_context()
-            context.add_cookies(cookies)
-            print("已加载保存的cookies")
-        else:
-            context = browser.new_context()
-        
-        page = context.new_page()
+    label = f"[{start_year}-{end_year}]"
+
+    search_url = SEARCH_URL.format(keyword=keyword, start_year=start_year, end_year=end_year)
+    cache_key = f"{keyword}:{start_year}-{end_year}"
+    print(f"\n{label} 正在请求搜索页: {search_url}")
+    async with page_semaphore:
+        rows, total_count = await fetch_rows_http(session, search_url, cache_key, 1)
+
+    if rows is None:
+        print(f"{label} 第 1 页获取失败")
+        writer.mark_failed(cache_key, 1)
+        return 0
+    page_size = len(rows)
+    if page_size == 0:
+        print(f"{label} 未找到数据，请检查是否需要登录或关键词是否正确")
+        return 0
+    if total_count:
+        print(f"{label} 总项目数: {total_count}")
+    projects = parse_rows(rows, seen_titles)
+    writer.write_page(projects, cache_key, 1)
+
+    async def fetch(page_num):
+        async with page_semaphore:
+            page_rows, _ = await fetch_rows_http(session, search_url, cache_key, page_num)
+        if page_rows is None:
+            print(f"{label} 第 {page_num} 页获取失败")
+            writer.mark_failed(cache_key, page_num)
+            return 0
+        if not page_rows:
+            # 总项目数对应的最后几页可能实际为空，说明结果已经结束，不算失败
+            print(f"{label} 第 {page_num} 页没有数据")
+            return 0
+        page_projects = parse_rows(page_rows, seen_titles)
+        writer.write_page(page_projects, cache_key, page_num)
+        print(f"{label} 第 {page_num} 页新增 {len(page_projects)} 个项目")
+        return len(page_projects)
+
+    # 跳过断点记录中已完成的页
+    start_page = max(2, writer.last_page(cache_key) + 1)
+    if total_count:
+        total_pages = min(math.ceil(total_count / page_size), max_pages)
+        counts = await asyncio.gather(*[fetch(n) for n in range(start_page, total_pages + 1)])
+        collected = len(projects) + sum(counts)
+    else:
+        # 本分片页面中没有总项目数，无法计算页数，只能逐页请求，直到某页为空或与第1页相同
+        print(f"{label} 无法获取总项目数，逐页请求直到没有数据")
+        collected = len(projects)
+        for page_num in range(start_page, max_pages + 1):
+            async with page_semaphore:
+                page_rows, _ = await fetch_rows_http(session, search_url, cache_key, page_num)
+            if page_rows is None:
+                print(f"{label} 第 {page_num} 页获取失败")
+                writer.mark_failed(cache_key, page_num)
+                break
+            if not page_rows or page_rows[0]['title'] == rows[0]['title']:
+                break
+            page_projects = parse_rows(page_rows, seen_titles)
+            writer.write_page(page_projects, cache_key, page_num)
+            print(f"{label} 第 {page_num} 页新增 {len(page_projects)} 个项目")
+            collected += len(page_projects)
+
+    print(f"{label} 已收集 {collected} 个项目")
+    return collected
+
+
+async def fetch_page(context, writer, search_url, cache_key, page_num, seen_titles, semaphore, first_title=None, max_retries=3):
+    """
+    直接通过页码URL打开并解析一页，返回写入的项目数。磁盘缓存有效时不打开页面
+
+    参数:
+        context: 浏览器上下文
+        writer: 逐页写入CSV的ProjectWriter
+        search_url: 搜索URL
+        cache_key: 磁盘缓存键
+        page_num: 页码
+        seen_titles: 去重集合
+        semaphore: 限制同时打开的页面数
+        first_title: 第1页首个项目的标题；若本页首个标题与之相同，说明网站忽略了页码参数，返回None
+        max_retries: 最大重试次数
+    """
+    cached = cache_get(cache_key, page_num)
+    if cached is not None:
+        rows = cached['rows']
+        if first_title is not None and rows[0]['title'] == first_title:
+            return None
+        projects = parse_rows(rows, seen_titles)
+        writer.write_page(projects, cache_key, page_num)
+        print(f"第 {page_num} 页（缓存）新增 {len(projects)} 个项目")
+        return len(projects)
+
+    url = page_url(search_url, page_num)
+    async with semaphore:
+        page = await context.new_page()
         page.set_default_timeout(60000)
-        
-        # 先访问首页
-        print("正在访问首页...")
-        page.goto("https://fund.cingta.com/", timeout=60000)
-        time.sleep(3)
-        
-        print(f"请在浏览器中登录（如果需要），等待{login_wait}秒...")
-        time.sleep(login_wait)
-        
-        # 保存cookies
-        cookies = context.cookies()
-        with open(cookie_file, 'w') as f:
-            json.dump(cookies, f)
-        print("已保存cookies")
-        
-        # 构建搜索URL
-        search_url = f"https://fund.cingta.com/fund/list?keyword={keyword}&searchtype=(立项年份={start_year}-{end_year})"
-        print(f"\n正在访问搜索页: {search_url}")
-        page.goto(search_url, timeout=60000)
-        
-        # 等待页面加载
-        print("等待搜索结果加载...")
-        time.sleep(5)
-        
-        # 等待列表加载
         try:
-            page.wait_for_selector('.list-item', timeout=30000)
-            print("找到列表项!")
+            for attempt in range(max_retries + 1):
+                try:
+                    await page.goto(url, timeout=60000)
+                    try:
+                        await page.wait_for_selector('.list-item', timeout=30000)
+                    except PlaywrightTimeoutError:
+                        # 页面已打开但没有列表项，说明已超出实际结果范围，按空页处理，不再重试
+                        print(f"第 {page_num} 页没有数据")
+                        return 0
+                    try:
+                        await page.wait_for_selector('.el-loading-mask', state='hidden', timeout=5000)
+                    except:
+                        pass
+
+                    rows = await read_items(page)
+                    if first_title is not None and rows and rows[0]['title'] == first_title:
+                        return None
+                    cache_set(cache_key, page_num, rows)
+
+                    projects = parse_rows(rows, seen_titles)
+                    writer.write_page(projects, cache_key, page_num)
+                    print(f"第 {page_num} 页新增 {len(projects)} 个项目")
+                    return len(projects)
+                except Exception as e:
+                    if attempt < max_retries:
+                        print(f"第 {page_num} 页加载失败，重试 {attempt + 1}/{max_retries}: {e}")
+                        await asyncio.sleep(3)
+                    else:
+                        print(f"第 {page_num} 页加载失败，已放弃: {e}")
+            if first_title is None:
+                writer.mark_failed(cache_key, page_num)
+                return 0
+            return None
+        finally:
+            await page.close()
+
+
+async def block_unneeded(route):
+    """拦截图片、样式、字体等资源及统计脚本请求，数据接口始终放行"""
+    request = route.request
+    host = urlparse(request.url).hostname or ''
+    if any(host == h or host.endswith('.' + h) for h in BLOCKED_HOSTS):
+        await route.abort()
+    elif request.resource_type in BLOCKED_RESOURCE_TYPES and '/api/' not in request.url:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# 首个标题（折叠空白后）与翻页前不同时返回true，用于确认翻页后的内容已渲染
+FIRST_TITLE_CHANGED_JS = """
+old => {
+    const e = document.querySelector('.list-item .title');
+    return !!e && e.textContent.split(/\\s+/).filter(Boolean).join(' ') !== old;
+}
+"""
+
+
+def find_total(data):
+    """
+    在列表接口返回的JSON中查找总数，返回 (总数, 同层列表的长度)，找不到时返回 (0, 0)
+
+    只认同一层级里同时带有列表数据的total类字段（如 {"total": N, "list": [...]}），
+    也会查找常见的data/result包装层。列表长度供调用方与页面上的列表项数核对，避免误取其他接口的计数
+    """
+    if not isinstance(data, dict):
+        return 0, 0
+
+    lists = [value for value in data.values() if isinstance(value, list)]
+    if lists:
+        for key in ('total', 'totalCount', 'total_count'):
+            value = data.get(key)
+            if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+                return value, len(lists[0])
+
+    for key in ('data', 'result'):
+        total, size = find_total(data.get(key))
+        if total:
+            return total, size
+    return 0, 0
+
+
+def is_list_response(response):
+    """判断是否为页面加载列表数据的接口响应"""
+    return response.request.resource_type in ('xhr', 'fetch') and response.ok
+
+
+async def click_and_wait(page, button, timeout=10000):
+    """点击按钮并等待随之发出的数据接口返回，超时未等到响应时返回False"""
+    clicked = False
+    try:
+        async with page.expect_response(is_list_response, timeout=timeout):
+            await button.click()
+            clicked = True
+    except PlaywrightTimeoutError:
+        # 点击本身超时属于真正的失败，交给调用方处理
+        if not clicked:
+            raise
+        return False
+    return True
+
+
+async def scrape_shard(context, writer, keyword, start_year, end_year, seen_titles, page_semaphore):
+    """
+    爬取单个年份区间的全部分页，返回本分片写入的项目数
+
+    参数:
+        context: 已加载登录状态的浏览器上下文
+        writer: 逐页写入CSV的ProjectWriter
+        keyword: 搜索关键词
+        start_year: 起始年份
+        end_year: 结束年份
+        seen_titles: 各分片共享的去重集合
+        page_semaphore: 限制按页码并发打开的页面数
+    """
+    collected = 0
+    label = f"[{start_year}-{end_year}]"
+
+    page = await context.new_page()
+    page.set_default_timeout(60000)
+
+    # 构建搜索URL
+    search_url = SEARCH_URL.format(keyword=keyword, start_year=start_year, end_year=end_year)
+    cache_key = f"{keyword}:{start_year}-{end_year}"
+    print(f"\n{label} 正在访问搜索页: {search_url}")
+
+    # 页面加载列表时直接从接口返回的JSON中读取总数，比解析页面文本更可靠
+    # 记录所有候选的 (总数, 列表长度)，等页面列表解析出来后再核对是哪个接口
+    api_totals = []
+    pending = []
+
+    async def read_total(response):
+        try:
+            total, size = find_total(await response.json())
+        except Exception:
+            return
+        if total:
+            api_totals.append((total, size))
+
+    def capture_total(response):
+        if is_list_response(response) and 'json' in response.headers.get('content-type', ''):
+            # 自己持有读取任务，移除监听后可以等它们全部完成再取值
+            pending.append(asyncio.ensure_future(read_total(response)))
+
+    page.on('response', capture_total)
+    try:
+        await page.goto(search_url, timeout=60000)
+    except Exception as e:
+        # 单个分片打不开时只记录失败，不影响其他分片，重新运行时由断点续爬补上
+        print(f"{label} 搜索页加载失败: {e}")
+        writer.mark_failed(cache_key, 1)
+        await page.close()
+        return 0
+
+    # 等待列表加载
+    print(f"{label} 等待搜索结果加载...")
+    try:
+        await page.wait_for_selector('.list-item', timeout=30000)
+        print(f"{label} 找到列表项!")
+    except:
+        print(f"{label} 等待列表超时，尝试其他选择器...")
+        try:
+            await page.wait_for_selector('.result-list', timeout=10000)
         except:
-            print("等待列表超时，尝试其他选择器...")
-            try:
-                page.wait_for_selector('.result-list', timeout=10000)
-            except:
-                pass
-        
-        # 获取总项目数
-        total_count = 0
-        total_elem = page.query_selector('.result-message')
-        if total_elem:
-            total_text = total_elem.inner_text()
-            print(f"结果信息: {total_text}")
-            # 修复正则表达式，使其能匹配带逗号的数字
-            total_match = re.search(r'项目数\s*([\d,]+)', total_text)
-            if total_match:
-                # 移除逗号并转换为整数
-                total_count = int(total_match.group(1).replace(',', ''))
-                print(f"总项目数: {total_count}")
+            pass
+
+    page.remove_listener('response', capture_total)
+    await asyncio.gather(*pending)
+
+    # 列表项从页面HTML中解析；只采用列表长度与本页列表项数一致的接口总数，否则从同一份HTML的结果信息里解析
+    rows, total_text = html_rows(await page.content())
+    text_total = parse_total_count(total_text)
+    api_total = next((total for total, size in api_totals if size == len(rows)), 0)
+    if api_total and text_total and api_total != text_total:
+        print(f"{label} 接口总数 {api_total} 与页面显示的 {text_total} 不一致，以页面为准")
+        api_total = 0
+
+    if api_total:
+        total_count = api_total
+        print(f"{label} 总项目数: {total_count}（来自列表接口）")
+    else:
+        total_count = text_total
+        if total_count:
+            print(f"{label} 总项目数: {total_count}")
         else:
-            # 尝试其他方式获取总项目数
-            try:
-                # 可能网站使用了不同的元素或格式
-                total_text = page.inner_text()
-                # 查找包含项目数的文本
-                total_match = re.search(r'项目数\s*([\d,]+)', total_text)
-                if total_match:
-                    total_count = int(total_match.group(1).replace(',', ''))
-                    print(f"从页面文本中找到总项目数: {total_count}")
-            except Exception as e:
-                print(f"无法获取总项目数: {e}")
-        
-        # 查找列表项
-        items = page.query_selector_all('.list-item')
-        print(f"找到 {len(items)} 个列表项")
-        
-        if len(items) == 0:
-            print("未找到数据，请检查是否需要登录或关键词是否正确")
-            browser.close()
-            return []
-        
-        page_num = 1
-        max_pages = 1000  # 增加最大页数
-        retry_count = 0
-        max_retries = 3
-        
-        while page_num <= max_pages:
-            print(f"\n正在解析第 {page_num} 页...")
-            
-            # 等待页面稳定
-            time.sleep(1)
-            
-            # 等待列表项出现
-            try:
-                page.wait_for_selector('.list-item', timeout=10000)
-            except:
-                print("等待列表项超时")
-                if retry_count < max_retries:
-                    retry_count += 1
-                    print(f"重试 {retry_count}/{max_retries}...")
-                    time.sleep(3)
-                    continue
-                else:
-                    print("重试次数已达上限，退出")
-                    break
-            
-            # 等待加载动画消失（如果有的话）
-            try:
-                page.wait_for_selector('.el-loading-mask', state='hidden', timeout=5000)
-            except:
-                pass
-            
-            items = page.query_selector_all('.list-item')
-            print(f"当前页找到 {len(items)} 个项目")
-            
-            if len(items) == 0:
-                if retry_count < max_retries:
-                    retry_count += 1
-                    print(f"未找到项目，重试 {retry_count}/{max_retries}...")
-                    time.sleep(3)
-                    page.reload()
-                    time.sleep(3)
-                    continue
-                else:
-                    print("重试次数已达上限，退出")
-                    break
-            
-            # 重置重试计数
-            retry_count = 0
-            page_project_count = 0
-            
-            for item in items:
-                project = {}
-                
-                # 获取标题
-                title_elem = item.query_selector('.title')
-                if title_elem:
-                    title_text = title_elem.inner_text().strip()
-                    title_text = re.sub(r'收藏.*$', '', title_text).strip()
-                    project['title'] = title_text
-                    
-                    # 去重检查
-                    if title_text in seen_titles:
-                        continue
-                    seen_titles.add(title_text)
-                
-                # 获取详细信息
-                item_wrap = item.query_selector('.item-wrap')
-                if item_wrap:
-                    info_items = item_wrap.query_selector_all('.item')
-                    for it in info_items:
-                        text = it.inner_text().strip()
-                        
-                        if '受资机构' in text:
-                            amount_match = re.search(r'(?:¥|金额[：:])\s*([\d.]+)\s*万元', text)
-                            if amount_match:
-                                project['amount'] = amount_match.group(1) + '万元'
-                            inst_match = re.search(r'受资机构[：:]\s*(.+?)(?:\s*¥|\s*金额)', text)
-                            if inst_match:
-                                project['institution'] = inst_match.group(1).strip()
-                        
-                        if '负责人' in text:
-                            pi_match = re.search(r'负责人[：:]\s*(.+?)\s*立项年份', text)
-                            if pi_match:
-                                project['pi'] = pi_match.group(1).strip()
-                            year_match = re.search(r'立项年份[：:]\s*(\d{4})', text)
-                            if year_match:
-                                project['year'] = year_match.group(1)
-                        
-                        if '资助机构' in text:
-                            funder_match = re.search(r'资助机构[：:]\s*(.+?)\s*申报领域', text)
-                            if funder_match:
-                                project['funder'] = funder_match.group(1).strip()
-                            field_match = re.search(r'申报领域[：:]*\s*(.+?)$', text)
-                            if field_match:
-                                field = field_match.group(1).strip()
-                                project['field'] = field if field != '--' else ''
-                
-                if project.get('title'):
-                    all_projects.append(project)
-                    page_project_count += 1
-            
-            print(f"本页新增 {page_project_count} 个项目，已收集 {len(all_projects)} 个项目")
-            
-            if total_count > 0 and len(all_projects) >= total_count:
-                print("已收集所有项目")
+            print(f"{label} 无法获取总项目数")
+
+    print(f"{label} 找到 {len(rows)} 个列表项")
+    cache_set(cache_key, 1, rows, total_count)
+
+    if len(rows) == 0:
+        print(f"{label} 未找到数据，请检查是否需要登录或关键词是否正确")
+        await page.close()
+        return 0
+
+    max_pages = 1000  # 增加最大页数
+
+    # 网站支持页码参数时，直接并发打开各页，无需逐页点击
+    page_size = len(rows)
+    total_pages = min(math.ceil(total_count / page_size), max_pages) if total_count else 0
+    if total_pages > 1:
+        first_title = rows[0]['title'] or ""
+        second_page = await fetch_page(context, writer, search_url, cache_key, 2, seen_titles, page_semaphore, first_title=first_title)
+        if second_page is not None:
+            print(f"{label} 支持页码参数，并发获取共 {total_pages} 页")
+            first_page = parse_rows(rows, seen_titles)
+            writer.write_page(first_page, cache_key, 1)
+            # 跳过断点记录中已完成的页
+            start_page = max(3, writer.last_page(cache_key) + 1)
+            counts = await asyncio.gather(*[
+                fetch_page(context, writer, search_url, cache_key, n, seen_titles, page_semaphore)
+                for n in range(start_page, total_pages + 1)
+            ])
+            collected = len(first_page) + second_page + sum(counts)
+            print(f"{label} 已收集 {collected} 个项目")
+            await page.close()
+            return collected
+        print(f"{label} 页码参数无效，改为逐页点击翻页")
+
+    page_num = 1
+    retry_count = 0
+    max_retries = 3
+
+    while page_num <= max_pages:
+        print(f"\n{label} 正在解析第 {page_num} 页...")
+
+        # 等待列表项出现
+        try:
+            await page.wait_for_selector('.list-item', timeout=10000)
+        except:
+            print(f"{label} 等待列表项超时")
+            if retry_count < max_retries:
+                retry_count += 1
+                print(f"{label} 重试 {retry_count}/{max_retries}...")
+                await asyncio.sleep(3)
+                continue
+            else:
+                print(f"{label} 重试次数已达上限，退出")
+                writer.mark_failed(cache_key, page_num)
                 break
-            
-            # 查找下一页按钮
-            next_btn = page.query_selector('.el-pagination .btn-next')
-            if not next_btn:
-                # 尝试其他选择器
-                next_btn = page.query_selector('button.btn-next')
-            if not next_btn:
-                next_btn = page.query_selector('.el-pagination button:last-child')
-            
-            if not next_btn:
-                print("找不到下一页按钮，退出")
+
+        # 等待加载动画消失（如果有的话）
+        try:
+            await page.wait_for_selector('.el-loading-mask', state='hidden', timeout=5000)
+        except:
+            pass
+
+        rows = await read_items(page)
+        print(f"{label} 当前页找到 {len(rows)} 个项目")
+
+        if len(rows) == 0:
+            if retry_count < max_retries:
+                retry_count += 1
+                print(f"{label} 未找到项目，重试 {retry_count}/{max_retries}...")
+                await asyncio.sleep(3)
+                # 只等待load，列表是否出现交给循环开头的wait_for_selector判断
+                try:
+                    await page.reload()
+                except Exception as e:
+                    print(f"{label} 刷新页面失败: {e}")
+                continue
+            else:
+                print(f"{label} 重试次数已达上限，退出")
+                writer.mark_failed(cache_key, page_num)
                 break
-            
-            is_disabled = next_btn.get_attribute('disabled')
-            btn_class = next_btn.get_attribute('class') or ''
-            if is_disabled is not None or 'is-disabled' in btn_class or 'disabled' in btn_class:
-                print("已到达最后一页")
+
+        # 重置重试计数
+        retry_count = 0
+
+        # 网站不支持页码参数时无法直接跳页，只能点击经过断点前已完成的页，但不再重复解析
+        if page_num <= writer.last_page(cache_key):
+            print(f"{label} 第 {page_num} 页上次已完成，跳过解析")
+        else:
+            page_projects = parse_rows(rows, seen_titles)
+            writer.write_page(page_projects, cache_key, page_num)
+            collected += len(page_projects)
+
+            print(f"{label} 本页新增 {len(page_projects)} 个项目，已收集 {collected} 个项目")
+
+        if total_count > 0 and collected >= total_count:
+            print(f"{label} 已收集所有项目")
+            break
+
+        # 查找下一页按钮
+        next_btn = await page.query_selector('.el-pagination .btn-next')
+        if not next_btn:
+            # 尝试其他选择器
+            next_btn = await page.query_selector('button.btn-next')
+        if not next_btn:
+            next_btn = await page.query_selector('.el-pagination button:last-child')
+
+        if not next_btn:
+            print(f"{label} 找不到下一页按钮，退出")
+            break
+
+        is_disabled = await next_btn.get_attribute('disabled')
+        btn_class = await next_btn.get_attribute('class') or ''
+        if is_disabled is not None or 'is-disabled' in btn_class or 'disabled' in btn_class:
+            print(f"{label} 已到达最后一页")
+            break
+
+        try:
+            # 记录当前第一个项目的标题，用于检测页面是否真的翻页了
+            old_first_title = rows[0]['title'] or ""
+
+            # 点击下一页，等待列表接口返回后再检查内容（click会自动滚动到按钮位置）
+            if not await click_and_wait(page, next_btn):
+                print(f"{label} 未等到列表接口响应")
+            page_num += 1
+
+            # 在浏览器内等待首个标题变化，新内容渲染后立即返回
+            try:
+                await page.wait_for_function(FIRST_TITLE_CHANGED_JS, arg=old_first_title, timeout=5000)
+            except PlaywrightTimeoutError:
+                print(f"{label} 页面内容未变化，可能翻页失败")
+
+        except Exception as e:
+            print(f"{label} 点击下一页失败: {e}")
+            if retry_count < max_retries:
+                retry_count += 1
+                print(f"{label} 重试 {retry_count}/{max_retries}...")
+                await asyncio.sleep(3)
+                continue
+            else:
+                writer.mark_failed(cache_key, page_num + 1)
                 break
-            
+
+    await page.close()
+    return collected
+
+
+async def login_phase(p, login_wait):
+    """
+    以有界面模式打开浏览器，供用户手动登录
+
+    返回 (storage_state, user_agent)，供后续无头爬取沿用同一会话
+    """
+    browser = await p.chromium.launch(headless=False)
+
+    # 尝试加载已保存的登录状态（cookies和localStorage）
+    storage_file = 'storage.json'
+    if os.path.exists(storage_file):
+        context = await browser.new_context(storage_state=storage_file)
+        print("已加载保存的登录状态")
+    else:
+        context = await browser.new_context()
+
+    page = await context.new_page()
+    page.set_default_timeout(60000)
+
+    # 先访问首页
+    print("正在访问首页...")
+    await page.goto("https://fund.cingta.com/", timeout=60000)
+
+    print(f"请在浏览器中登录（如果需要），等待{login_wait}秒...")
+    await asyncio.sleep(login_wait)
+
+    # 保存登录状态
+    storage_state = await context.storage_state(path=storage_file)
+    print("已保存登录状态")
+    user_agent = await page.evaluate("navigator.userAgent")
+
+    await browser.close()
+    return storage_state, user_agent
+
+
+async def scrape_phase(p, writer, keyword, start_year, end_year, storage_state, user_agent, concurrency, seen_titles):
+    """
+    登录完成后爬取列表页，返回项目总数
+
+    列表页若能直接通过HTTP获取，则完全不再启动浏览器，改用aiohttp请求；否则以无头模式启动浏览器，
+    为每个分片创建独立的上下文。两种方式都按立项年份拆分为多个分片并发爬取
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    page_semaphore = asyncio.Semaphore(concurrency)
+    years = range(start_year, end_year + 1)
+
+    jar = aiohttp.CookieJar()
+    jar.update_cookies({c['name']: c['value'] for c in storage_state['cookies']})
+    # 整个爬取过程共用一个会话，保持长连接并缓存DNS，避免每次请求重新握手
+    connector = aiohttp.TCPConnector(limit=50, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=30)
+    async with aiohttp.ClientSession(
+        connector=connector,
+        cookie_jar=jar,
+        headers={'User-Agent': user_agent},
+        timeout=aiohttp.ClientTimeout(total=30),
+    ) as session:
+        search_url = SEARCH_URL.format(keyword=keyword, start_year=start_year, end_year=end_year)
+        if await probe_http(session, search_url):
+            print("列表页可直接通过HTTP获取，无需浏览器")
+            await asyncio.gather(*[
+                scrape_shard_http(session, writer, keyword, year, year, seen_titles, page_semaphore)
+                for year in years
+            ])
+            return writer.count
+
+    print("列表页需要浏览器渲染，使用无头浏览器爬取")
+    browser = await p.chromium.launch(headless=True, args=HEADLESS_ARGS)
+
+    # 每个分片使用独立的上下文，共享同一个浏览器实例
+    async def run_shard(year):
+        async with semaphore:
+            # 沿用登录时的User-Agent，避免无头模式的标识暴露
+            shard_context = await browser.new_context(
+                user_agent=user_agent,
+                java_script_enabled=True,
+                bypass_csp=True,
+                viewport={'width': 1280, 'height': 800},
+                storage_state=storage_state,
+            )
+            await shard_context.route("**/*", block_unneeded)
             try:
-                # 滚动到分页区域确保可见
-                next_btn.scroll_into_view_if_needed()
-                time.sleep(0.5)
-                
-                # 记录当前第一个项目的标题，用于检测页面是否真的翻页了
-                first_item = page.query_selector('.list-item .title')
-                old_first_title = first_item.inner_text() if first_item else ""
-                
-                # 点击下一页
-                next_btn.click()
-                page_num += 1
-                
-                # 等待页面变化
-                time.sleep(2)
-                
-                # 等待新内容加载
-                for _ in range(10):
-                    time.sleep(0.5)
-                    new_first_item = page.query_selector('.list-item .title')
-                    new_first_title = new_first_item.inner_text() if new_first_item else ""
-                    if new_first_title and new_first_title != old_first_title:
-                        break
-                else:
-                    print("页面内容未变化，可能翻页失败")
-                    # 额外等待
-                    time.sleep(2)
-                
-            except Exception as e:
-                print(f"点击下一页失败: {e}")
-                if retry_count < max_retries:
-                    retry_count += 1
-                    print(f"重试 {retry_count}/{max_retries}...")
-                    time.sleep(3)
-                    continue
-                else:
-                    break
-        
-        browser.close()
-    
-    return all_projects
+                return await scrape_shard(shard_context, writer, keyword, year, year, seen_titles, page_semaphore)
+            finally:
+                await shard_context.close()
 
+    try:
+        await asyncio.gather(*[run_shard(year) for year in years])
+    finally:
+        await browser.close()
+    return writer.count
 
-def save_to_csv(projects, keyword, start_year, end_year):
-    """保存数据到CSV文件"""
-    if not projects:
-        print("没有数据可保存")
-        return
-    
-    # 生成文件名
+
+async def login(login_wait):
+    """单独执行登录，返回 (storage_state, user_agent)，供多个关键词的爬取进程共用"""
+    async with async_playwright() as p:
+        return await login_phase(p, login_wait)
+
+
+async def scrape_fund(keyword, writer, start_year=2022, end_year=2026, login_wait=30, concurrency=5, login_state=None,
+                      seen_titles=None):
+    """
+    爬取基金项目数据，每解析完一页就写入CSV，返回项目总数
+
+    先以有界面模式登录，再进入无头爬取阶段
+
+    参数:
+        keyword: 搜索关键词
+        writer: 逐页写入CSV的ProjectWriter
+        start_year: 起始年份
+        end_year: 结束年份
+        login_wait: 登录等待时间（秒）
+        concurrency: 同时爬取的分片数
+        login_state: 已有的 (storage_state, user_agent)，提供时跳过登录
+        seen_titles: 去重集合，断点续爬时包含已写入的题目
+    """
+    if seen_titles is None:
+        seen_titles = set()  # 用于去重
+
+    async with async_playwright() as p:
+        if login_state is None:
+            login_state = await login_phase(p, login_wait)
+        storage_state, user_agent = login_state
+        return await scrape_phase(p, writer, keyword, start_year, end_year, storage_state, user_agent, concurrency,
+                                  seen_titles)
+
+
+def scrape_keyword(keyword, start_year, end_year, login_wait, concurrency, login_state=None):
+    """
+    爬取单个关键词并写入对应的CSV文件，返回 (输出文件, 项目数)
+
+    定义在模块顶层，以便作为multiprocessing.Pool的任务函数
+    """
     output_file = f'fund_{keyword}_{start_year}-{end_year}.csv'
-    
-    with open(output_file, 'w', encoding='utf-8-sig', newline='') as f:
-        fieldnames = ['title', 'institution', 'pi', 'funder', 'amount', 'year', 'field']
-        header_names = {
-            'title': '题目', 
-            'institution': '受资机构', 
-            'pi': '负责人', 
-            'funder': '资助机构', 
-            'amount': '金额', 
-            'year': '立项年份', 
-            'field': '申报领域'
-        }
-        writer = csv.writer(f)
-        writer.writerow([header_names[fn] for fn in fieldnames])
-        for p in projects:
-            writer.writerow([
-                p.get('title', ''),
-                p.get('institution', ''),
-                p.get('pi', ''),
-                p.get('funder', ''),
-                p.get('amount', ''),
-                p.get('year', ''),
-                p.get('field', '')
-            ])
-    
-    print(f"数据已保存到 {output_file}")
-    return output_file
+    checkpoint = Checkpoint(f'ckpt.{keyword}.json', {
+        'keyword': keyword,
+        'start_year': start_year,
+        'end_year': end_year,
+        'output': output_file,
+    })
+
+    # 存在与本次参数一致的断点时，在原CSV后追加，并用已写入的题目去重
+    seen_titles = set()
+    count = 0
+    if os.path.exists(output_file) and checkpoint.load():
+        with open(output_file, encoding='utf-8-sig', newline='') as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            for row in reader:
+                if row:
+                    seen_titles.add(title_key(row[0]))
+                    count += 1
+        mode = 'a'
+        print(f"[{keyword}] 发现断点，从上次中断处继续爬取（已有 {count} 个项目）")
+    else:
+        mode = 'w'
+
+    # 爬取数据，边爬取边写入CSV
+    with open(output_file, mode, encoding='utf-8-sig', newline='') as f:
+        writer = ProjectWriter(f, checkpoint=checkpoint, count=count)
+        count = asyncio.run(scrape_fund(
+            keyword=keyword,
+            writer=writer,
+            start_year=start_year,
+            end_year=end_year,
+            login_wait=login_wait,
+            concurrency=concurrency,
+            login_state=login_state,
+            seen_titles=seen_titles
+        ))
+
+    # 有页面获取失败时保留断点，重新运行时从失败的页继续；全部完成后才删除断点
+    if writer.failed_pages:
+        pages = '、'.join(f"{shard} 第{page_num}页" for shard, page_num in writer.failed_pages)
+        print(f"[{keyword}] 以下页面获取失败: {pages}")
+        print(f"[{keyword}] 已保留断点 {checkpoint.path}，使用相同参数重新运行即可继续")
+    else:
+        checkpoint.remove()
+        if not count:
+            os.remove(output_file)
+    return output_file, count
+
+
+class Checkpoint:
+    """
+    断点记录：保存每个年份分片已连续完成的最后一页，中断后重新运行时跳过这些页
+
+    参数:
+        path: 断点文件路径
+        meta: 本次运行的参数（关键词、年份范围、输出文件），与断点文件中的不一致时不续爬
+    """
+
+    def __init__(self, path, meta):
+        self.path = path
+        self.meta = meta
+        self.shards = {}
+        self.pending = {}  # 已完成、但前面还有未完成页的页码
+
+    def load(self):
+        """读取断点文件，参数一致时返回True"""
+        try:
+            with open(self.path, 'rb') as f:
+                data = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return False
+        if data.get('meta') != self.meta:
+            return False
+        self.shards = data['shards']
+        return True
+
+    def last_page(self, shard):
+        """分片已连续完成的最后一页，没有记录时为0"""
+        return self.shards.get(shard, 0)
+
+    def done(self, shard, page_num):
+        """标记一页已写入，并推进该分片连续完成的最后一页"""
+        last = self.shards.get(shard, 0)
+        if page_num <= last:
+            return
+
+        pending = self.pending.setdefault(shard, set())
+        pending.add(page_num)
+        while last + 1 in pending:
+            last += 1
+            pending.discard(last)
+        self.shards[shard] = last
+        self.save()
+
+    def save(self):
+        """先写临时文件再替换，避免中断时留下不完整的断点文件"""
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps({'meta': self.meta, 'shards': self.shards}))
+        os.replace(tmp_path, self.path)
+
+    def remove(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class ProjectWriter:
+    """
+    边爬取边把项目写入CSV，中途出错时已解析的页面不会丢失
+
+    参数:
+        f: 以newline=''打开的CSV文件，追加模式下不再写表头
+        fsync_every: 每写入多少页强制刷盘一次
+        checkpoint: 断点记录，每写入一页就更新
+        count: 文件中已有的项目数
+    """
+
+    header_names = {
+        'title': '题目',
+        'institution': '受资机构',
+        'pi': '负责人',
+        'funder': '资助机构',
+        'amount': '金额',
+        'year': '立项年份',
+        'field': '申报领域'
+    }
+
+    def __init__(self, f, fsync_every=50, checkpoint=None, count=0):
+        self.f = f
+        self.fsync_every = fsync_every
+        self.checkpoint = checkpoint
+        self.pages = 0
+        self.count = count
+        self.failed_pages = []
+        self.writer = csv.writer(f)
+        if f.tell() == 0:
+            self.writer.writerow([self.header_names[fn] for fn in Project._fields])
+
+    def last_page(self, shard):
+        """分片在断点记录中已连续完成的最后一页，没有断点时为0"""
+        return self.checkpoint.last_page(shard) if self.checkpoint else 0
+
+    def mark_failed(self, shard, page_num):
+        """记录重试后仍获取失败的页，断点记录会停在这一页之前"""
+        self.failed_pages.append((shard, page_num))
+
+    def write_page(self, projects, shard=None, page_num=None):
+        """
+        写入一页项目，Project本身就是按列排列的元组，可直接交给writerows
+
+        提供shard和page_num时，写入后更新断点记录
+        """
+        self.writer.writerows(projects)
+        self.count += len(projects)
+        self.pages += 1
+
+        if self.pages % self.fsync_every == 0:
+            self.f.flush()
+            os.fsync(self.f.fileno())
+
+        if self.checkpoint and shard is not None:
+            # 断点记录的页必须已经写出到文件
+            self.f.flush()
+            self.checkpoint.done(shard, page_num)
 
 
 def main():
     parser = argparse.ArgumentParser(description='青塔自科云基金项目爬虫')
-    parser.add_argument('-k', '--keyword', type=str, default='电动汽车',
-                        help='搜索关键词 (默认: 电动汽车)')
+    parser.add_argument('-k', '--keyword', type=str, nargs='+',
+                        help='搜索关键词，可指定多个 (默认: 电动汽车)')
+    parser.add_argument('--keywords-file', type=str,
+                        help='关键词文件，每行一个关键词，与 --keyword 合并')
     parser.add_argument('-s', '--start-year', type=int, default=2022,
                         help='起始年份 (默认: 2022)')
     parser.add_argument('-e', '--end-year', type=int, default=2026,
                         help='结束年份 (默认: 2026)')
     parser.add_argument('-w', '--wait', type=int, default=30,
                         help='登录等待时间秒数 (默认: 30)')
+    parser.add_argument('-c', '--concurrency', type=int, default=5,
+                        help='同时爬取的年份分片数 (默认: 5)')
+    parser.add_argument('-p', '--processes', type=int, default=os.cpu_count(),
+                        help='多个关键词时的并行进程数 (默认: CPU核数)')
     
     args = parser.parse_args()
+
+    keywords = list(args.keyword or [])
+    if args.keywords_file:
+        with open(args.keywords_file, encoding='utf-8') as f:
+            keywords.extend(line.strip() for line in f if line.strip())
+    keywords = list(dict.fromkeys(keywords)) or ['电动汽车']  # 去重并保持顺序
     
     print("="*50)
     print("青塔自科云基金项目爬虫")
     print("="*50)
-    print(f"关键词: {args.keyword}")
+    print(f"关键词: {', '.join(keywords)}")
     print(f"年份范围: {args.start_year} - {args.end_year}")
     print(f"登录等待: {args.wait}秒")
+    print(f"并发分片: {args.concurrency}")
     print("="*50)
-    
-    # 爬取数据
-    projects = scrape_fund(
-        keyword=args.keyword,
-        start_year=args.start_year,
-        end_year=args.end_year,
-        login_wait=args.wait
-    )
-    
-    # 保存数据
-    print(f"\n总共收集到 {len(projects)} 个项目")
-    if projects:
-        save_to_csv(projects, args.keyword, args.start_year, args.end_year)
+
+    if len(keywords) == 1:
+        results = [scrape_keyword(keywords[0], args.start_year, args.end_year, args.wait, args.concurrency)]
+    else:
+        # 先统一登录一次，再按关键词分配到多个进程，每个进程使用各自的浏览器实例
+        login_state = asyncio.run(login(args.wait))
+        processes = max(1, min(args.processes or 1, len(keywords)))
+        print(f"\n使用 {processes} 个进程爬取 {len(keywords)} 个关键词")
+        with multiprocessing.Pool(processes=processes) as pool:
+            results = pool.starmap(scrape_keyword, [
+                (keyword, args.start_year, args.end_year, args.wait, args.concurrency, login_state)
+                for keyword in keywords
+            ])
+
+    for keyword, (output_file, count) in zip(keywords, results):
+        print(f"\n[{keyword}] 总共收集到 {count} 个项目")
+        if count:
+            print(f"数据已保存到 {output_file}")
+        else:
+            print("没有数据可保存")
 
 
 if __name__ == '__main__':